@@ -1,10 +1,24 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
-gas_cost = np.genfromtxt("data/erc_7160_add_token_uris.csv", dtype=np.uint64)
+gas_cost = np.loadtxt("data/erc_7160_add_token_uris.csv", dtype=np.uint64)
+cumulative_gas_cost = np.cumsum(gas_cost)
 
-plt.plot(gas_cost)
-plt.xlabel("Batch Number (batches of 200 tokens)")
-plt.ylabel("Estimated Gas Cost (gas units)")
-plt.title("Gas Cost Over Time for ERC-7160 Metadata Additions")
-plt.show()
\ No newline at end of file
+idx = np.arange(gas_cost.size, dtype=np.float64)
+y = gas_cost.astype(np.float64)
+segments = np.column_stack([idx[:-1], y[:-1], idx[1:], y[1:]]).reshape(-1, 2, 2)
+
+fig, (ax, cumulative_ax) = plt.subplots(2, 1, sharex=True)
+
+ax.add_collection(LineCollection(segments))
+ax.autoscale_view()
+ax.set_ylabel("Estimated Gas Cost (gas units)")
+ax.set_title("Gas Cost Over Time for ERC-7160 Metadata Additions")
+
+cumulative_ax.plot(idx, cumulative_gas_cost)
+cumulative_ax.set_xlabel("Batch Number (batches of 200 tokens)")
+cumulative_ax.set_ylabel("Cumulative Gas Cost (gas units)")
+
+fig.tight_layout()
+plt.show()